@@ -14,10 +14,23 @@ from scheduling.priority_preemptive import schedule_priority_preemptive
 from scheduling.round_robin import schedule_round_robin
 from scheduling.sjf_nonpreemptive import schedule_sjf_nonpreemptive
 from scheduling.srtf_preemptive import schedule_srtf_preemptive
+from scheduling.timeline import TimelineIndex
 
 
-def _format_timeline(segments: list[Segment]) -> str:
-    return " ".join(f"[{s.start}-{s.end}:{s.pid}]" for s in segments)
+# Long timelines are truncated in the label; only this many segments are rendered.
+_TIMELINE_MAX_SEGMENTS = 200
+
+
+def _format_timeline(index: TimelineIndex) -> str:
+    segments = index.segments
+    if len(segments) <= _TIMELINE_MAX_SEGMENTS:
+        shown = segments
+    else:
+        shown = index.slice(index.start, segments[_TIMELINE_MAX_SEGMENTS].start)
+    text = " ".join(f"[{s.start}-{s.end}:{s.pid}]" for s in shown)
+    if len(shown) < len(segments):
+        text += f" ... ({len(segments) - len(shown)} more segments, ends at t={index.end})"
+    return text
 
 
 class SchedulerApp(ttk.Frame):
@@ -330,10 +343,14 @@ class SchedulerApp(ttk.Frame):
 
             avg_wt = sum(m.waiting for m in metrics.values()) / len(metrics)
             avg_tat = sum(m.turnaround for m in metrics.values()) / len(metrics)
+            index = TimelineIndex(segments)
 
             self.status_var.set(title)
-            self.avg_var.set(f"Averages: WT={avg_wt:.2f}, TAT={avg_tat:.2f}")
-            self.timeline_var.set(f"Timeline: {_format_timeline(segments)}")
+            self.avg_var.set(
+                f"Averages: WT={avg_wt:.2f}, TAT={avg_tat:.2f}    "
+                f"CPU utilization={index.utilization():.0%}, Context switches={index.context_switches()}"
+            )
+            self.timeline_var.set(f"Timeline: {_format_timeline(index)}")
 
         except Exception as e:
             self.status_var.set(f"Error: {e}")
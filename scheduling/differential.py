@@ -0,0 +1,233 @@
+"""Differential testing of optimized scheduler engines against the reference schedulers.
+
+The schedulers in `scheduling/*.py` are the oracles. Every case is run through both
+the reference and the optimized engine; any difference in the timeline (or in the
+error raised) is shrunk to a minimal reproduction. Timings of both paths are
+recorded so speedups can be reported.
+
+Run with: python -m scheduling.differential
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .fast_engines import FAST_SCHEDULERS
+from .models import Process, Segment
+from .replication import SCHEDULERS, WorkloadSpec, generate_workload
+
+Engine = Callable[[Sequence[Process], int], List[Segment]]
+Outcome = Tuple[str, object]  # ("ok", segments) or ("error", "ExcType: message")
+
+QUANTA: Tuple[int, ...] = (1, 2, 3, 5)
+
+
+@dataclass(frozen=True)
+class Case:
+    processes: Tuple[Process, ...]
+    quantum: int = 2
+
+
+@dataclass
+class Mismatch:
+    algorithm: str
+    case: Case  # shrunk
+    expected: Outcome
+    actual: Outcome
+
+
+@dataclass
+class Timing:
+    reference: float = 0.0
+    optimized: float = 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.reference / self.optimized if self.optimized > 0 else float("inf")
+
+
+@dataclass
+class DifferentialReport:
+    cases: int = 0
+    mismatches: List[Mismatch] = field(default_factory=list)
+    timings: Dict[str, Timing] = field(default_factory=dict)  # algorithm -> totals over all cases
+    large: Dict[str, Timing] = field(default_factory=dict)  # algorithm -> single large workload
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def _outcome(engine: Engine, case: Case) -> Tuple[Outcome, float]:
+    start = time.perf_counter()
+    try:
+        result: Outcome = ("ok", engine(case.processes, case.quantum))
+    except Exception as e:
+        result = ("error", f"{type(e).__name__}: {e}")
+    return result, time.perf_counter() - start
+
+
+def _differs(reference: Engine, optimized: Engine, case: Case) -> bool:
+    return _outcome(reference, case)[0] != _outcome(optimized, case)[0]
+
+
+def adversarial_cases() -> Iterator[Case]:
+    """Hand-picked workloads that stress tie-breaking and idle handling."""
+
+    def procs(rows: Sequence[Tuple[int, int, int]]) -> Tuple[Process, ...]:
+        return tuple(Process(pid=f"P{i + 1}", arrival=a, burst=b, priority=pr) for i, (a, b, pr) in enumerate(rows))
+
+    workloads = [
+        procs([(0, 1, 0)]),
+        procs([(5, 3, 0)]),  # idle before the first arrival
+        procs([(0, 4, 1)] * 6),  # everything equal
+        procs([(0, b, 0) for b in (5, 3, 5, 3, 1, 1)]),  # equal arrivals, repeated bursts
+        procs([(a, 3, 2) for a in (4, 0, 4, 2, 0, 2)]),  # equal bursts and priorities
+        procs([(a, 2, 0) for a in (0, 10, 20, 30)]),  # idle gaps between jobs
+        procs([(0, 2, 0), (2, 2, 0), (4, 2, 0), (6, 2, 0)]),  # arrivals exactly at completions
+        procs([(0, 8, 3), (1, 4, 2), (2, 2, 1), (3, 1, 0)]),  # cascade of preemptions
+        procs([(0, 5, 0), (1, 5, 0), (1, 1, 1), (1, 1, 1)]),  # late ties behind a running job
+        procs([(i, 1, i % 3) for i in range(12)]),  # one arrival per tick
+    ]
+    # PIDs whose string order disagrees with their numeric order.
+    workloads.append(tuple(Process(pid=pid, arrival=0, burst=2) for pid in ("P10", "P2", "P1", "P9")))
+    for w in workloads:
+        for q in QUANTA:
+            yield Case(processes=w, quantum=q)
+
+
+def random_cases(n: int, seed: int = 0) -> Iterator[Case]:
+    rng = random.Random(seed)
+    for i in range(n):
+        spec = WorkloadSpec(
+            n_processes=rng.randint(1, 12),
+            arrival_range=(0, rng.choice((0, 3, 10, 40))),
+            burst_range=(1, rng.choice((1, 2, 5, 15))),
+            priority_range=(0, rng.choice((0, 1, 4))),
+        )
+        yield Case(processes=tuple(generate_workload(spec, seed * 1_000_003 + i)), quantum=rng.choice(QUANTA))
+
+
+def _candidates(case: Case) -> Iterator[Case]:
+    procs = case.processes
+    for i in range(len(procs)):
+        if len(procs) > 1:
+            yield replace(case, processes=procs[:i] + procs[i + 1 :])
+    for i, p in enumerate(procs):
+        for smaller in (
+            replace(p, arrival=0),
+            replace(p, arrival=p.arrival - 1),
+            replace(p, burst=1),
+            replace(p, burst=p.burst - 1),
+            replace(p, priority=0),
+            replace(p, priority=p.priority - 1),
+        ):
+            if smaller != p and smaller.arrival >= 0 and smaller.burst >= 1 and smaller.priority >= 0:
+                yield replace(case, processes=procs[:i] + (smaller,) + procs[i + 1 :])
+    if case.quantum > 1:
+        yield replace(case, quantum=1)
+
+
+def shrink(reference: Engine, optimized: Engine, case: Case) -> Case:
+    """Greedily simplify a failing case while it keeps failing."""
+    improved = True
+    while improved:
+        improved = False
+        for candidate in _candidates(case):
+            if _differs(reference, optimized, candidate):
+                case = candidate
+                improved = True
+                break
+    return case
+
+
+def run_differential(
+    algorithms: Optional[Sequence[str]] = None,
+    *,
+    random_count: int = 2000,
+    seed: int = 0,
+    large_n: int = 2000,
+    reference: Optional[Dict[str, Engine]] = None,
+    optimized: Optional[Dict[str, Engine]] = None,
+) -> DifferentialReport:
+    """Compare `optimized` engines with `reference` ones on adversarial and random cases.
+
+    Only the first mismatch per algorithm is shrunk and reported. When `large_n` > 0 both
+    paths are also timed on one workload of that size.
+    """
+    reference = SCHEDULERS if reference is None else reference
+    optimized = FAST_SCHEDULERS if optimized is None else optimized
+    keys = list(optimized) if algorithms is None else list(algorithms)
+    for key in keys:
+        if key not in reference or key not in optimized:
+            raise ValueError(f"Unknown algorithm: {key}")
+
+    report = DifferentialReport(timings={key: Timing() for key in keys})
+    cases = list(adversarial_cases()) + list(random_cases(random_count, seed))
+    report.cases = len(cases)
+
+    for key in keys:
+        ref, opt = reference[key], optimized[key]
+        timing = report.timings[key]
+        for case in cases:
+            expected, t_ref = _outcome(ref, case)
+            actual, t_opt = _outcome(opt, case)
+            timing.reference += t_ref
+            timing.optimized += t_opt
+            if expected != actual:
+                small = shrink(ref, opt, case)
+                report.mismatches.append(
+                    Mismatch(algorithm=key, case=small, expected=_outcome(ref, small)[0], actual=_outcome(opt, small)[0])
+                )
+                break
+
+    if large_n > 0:
+        spec = WorkloadSpec(n_processes=large_n, arrival_range=(0, 5 * large_n), burst_range=(1, 20), priority_range=(0, 10))
+        case = Case(processes=tuple(generate_workload(spec, seed)), quantum=2)
+        for key in keys:
+            expected, t_ref = _outcome(reference[key], case)
+            actual, t_opt = _outcome(optimized[key], case)
+            report.large[key] = Timing(reference=t_ref, optimized=t_opt)
+            if expected != actual and not any(m.algorithm == key for m in report.mismatches):
+                report.mismatches.append(Mismatch(algorithm=key, case=case, expected=expected, actual=actual))
+
+    return report
+
+
+def format_report(report: DifferentialReport) -> str:
+    lines = [f"Cases per algorithm: {report.cases}"]
+    for key, timing in report.timings.items():
+        line = f"  {key:8} ref={timing.reference:.3f}s opt={timing.optimized:.3f}s speedup={timing.speedup:.2f}x"
+        large = report.large.get(key)
+        if large is not None:
+            line += f"  | large: ref={large.reference:.3f}s opt={large.optimized:.3f}s speedup={large.speedup:.2f}x"
+        lines.append(line)
+    if report.ok:
+        lines.append("All engines match the reference.")
+    for m in report.mismatches:
+        lines.append(f"MISMATCH {m.algorithm} (q={m.case.quantum}):")
+        lines.append(f"  processes: {list(m.case.processes)}")
+        lines.append(f"  expected:  {m.expected}")
+        lines.append(f"  actual:    {m.actual}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Differential test of optimized scheduler engines.")
+    parser.add_argument("algorithms", nargs="*", help="algorithm keys (default: all)")
+    parser.add_argument("--cases", type=int, default=2000, help="number of random cases")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--large-n", type=int, default=2000, help="size of the timing workload (0 to skip)")
+    args = parser.parse_args(argv)
+
+    report = run_differential(args.algorithms or None, random_count=args.cases, seed=args.seed, large_n=args.large_n)
+    print(format_report(report))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
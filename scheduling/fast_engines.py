@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Callable, Deque, Dict, List, Sequence, Tuple
+
+from .fcfs import schedule_fcfs
+from .models import Process, Segment, merge_adjacent, validate_processes
+
+# Heap/deque-based engines producing the same timelines as the reference schedulers.
+# The references rescan the ready set (or pop from the front of a list) on every
+# dispatch, which is O(n^2); these run in O(n log n). FCFS is already a single sort
+# and has no separate engine. Check changes with `scheduling.differential`.
+
+
+def _idle_until(segments: List[Segment], t: int, next_t: int) -> int:
+    if t < next_t:
+        segments.append(Segment(start=t, end=next_t, pid="IDLE"))
+        return next_t
+    return t
+
+
+def _nonpreemptive(processes: Sequence[Process], key: Callable[[Process], Tuple]) -> List[Segment]:
+    validate_processes(processes)
+    procs = sorted(processes, key=lambda p: (p.arrival, p.pid))
+    ready: List[Tuple] = []
+    t = 0
+    i = 0
+    segments: List[Segment] = []
+
+    while ready or i < len(procs):
+        while i < len(procs) and procs[i].arrival <= t:
+            p = procs[i]
+            heapq.heappush(ready, (key(p), p.pid, p))
+            i += 1
+        if not ready:
+            t = _idle_until(segments, t, procs[i].arrival)
+            continue
+
+        _, _, chosen = heapq.heappop(ready)
+        segments.append(Segment(start=t, end=t + chosen.burst, pid=chosen.pid))
+        t += chosen.burst
+
+    return merge_adjacent(segments)
+
+
+def schedule_sjf_nonpreemptive_fast(processes: Sequence[Process]) -> List[Segment]:
+    """Non-preemptive SJF; tie-breakers: burst, arrival, PID."""
+    return _nonpreemptive(processes, lambda p: (p.burst, p.arrival, p.pid))
+
+
+def schedule_priority_nonpreemptive_fast(processes: Sequence[Process]) -> List[Segment]:
+    """Non-preemptive Priority; tie-breakers: priority, arrival, PID."""
+    return _nonpreemptive(processes, lambda p: (p.priority, p.arrival, p.pid))
+
+
+def schedule_srtf_preemptive_fast(processes: Sequence[Process]) -> List[Segment]:
+    """SRTF; tie-breakers: remaining, arrival, PID."""
+    validate_processes(processes)
+    procs = sorted(processes, key=lambda p: (p.arrival, p.pid))
+    ready: List[Tuple[int, int, str]] = []  # (remaining, arrival, pid)
+    t = 0
+    i = 0
+    segments: List[Segment] = []
+
+    while ready or i < len(procs):
+        while i < len(procs) and procs[i].arrival <= t:
+            p = procs[i]
+            heapq.heappush(ready, (p.burst, p.arrival, p.pid))
+            i += 1
+        if not ready:
+            t = _idle_until(segments, t, procs[i].arrival)
+            continue
+
+        remaining, arrival, pid = heapq.heappop(ready)
+        run_for = remaining if i == len(procs) else min(remaining, procs[i].arrival - t)
+        segments.append(Segment(start=t, end=t + run_for, pid=pid))
+        t += run_for
+        if remaining > run_for:
+            heapq.heappush(ready, (remaining - run_for, arrival, pid))
+
+    return merge_adjacent(segments)
+
+
+def schedule_priority_preemptive_fast(processes: Sequence[Process]) -> List[Segment]:
+    """Preemptive Priority; tie-breakers: priority, arrival, PID."""
+    validate_processes(processes)
+    procs = sorted(processes, key=lambda p: (p.arrival, p.pid))
+    remaining_time: Dict[str, int] = {p.pid: p.burst for p in procs}
+    ready: List[Tuple[int, int, str]] = []  # (priority, arrival, pid)
+    t = 0
+    i = 0
+    segments: List[Segment] = []
+
+    while ready or i < len(procs):
+        while i < len(procs) and procs[i].arrival <= t:
+            p = procs[i]
+            heapq.heappush(ready, (p.priority, p.arrival, p.pid))
+            i += 1
+        if not ready:
+            t = _idle_until(segments, t, procs[i].arrival)
+            continue
+
+        pid = ready[0][2]
+        remaining = remaining_time[pid]
+        run_for = remaining if i == len(procs) else min(remaining, procs[i].arrival - t)
+        segments.append(Segment(start=t, end=t + run_for, pid=pid))
+        t += run_for
+        remaining_time[pid] -= run_for
+        if remaining_time[pid] == 0:
+            heapq.heappop(ready)
+
+    return merge_adjacent(segments)
+
+
+def schedule_round_robin_fast(processes: Sequence[Process], quantum: int) -> List[Segment]:
+    """Round Robin with a fixed time quantum (FIFO ready queue)."""
+    validate_processes(processes)
+    if quantum <= 0:
+        raise ValueError("Quantum must be > 0")
+
+    procs = sorted(processes, key=lambda p: (p.arrival, p.pid))
+    remaining: Dict[str, int] = {p.pid: p.burst for p in procs}
+    queue: Deque[str] = deque()
+    t = 0
+    i = 0
+    segments: List[Segment] = []
+
+    while queue or i < len(procs):
+        while i < len(procs) and procs[i].arrival <= t:
+            queue.append(procs[i].pid)
+            i += 1
+        if not queue:
+            t = _idle_until(segments, t, procs[i].arrival)
+            continue
+
+        pid = queue.popleft()
+        run_for = min(quantum, remaining[pid])
+        segments.append(Segment(start=t, end=t + run_for, pid=pid))
+        t += run_for
+        remaining[pid] -= run_for
+
+        # Arrivals during the slice queue ahead of the preempted process.
+        while i < len(procs) and procs[i].arrival <= t:
+            queue.append(procs[i].pid)
+            i += 1
+        if remaining[pid] > 0:
+            queue.append(pid)
+
+    return merge_adjacent(segments)
+
+
+FAST_SCHEDULERS: Dict[str, Callable[[Sequence[Process], int], List[Segment]]] = {
+    "fcfs": lambda procs, _q: schedule_fcfs(procs),
+    "sjf": lambda procs, _q: schedule_sjf_nonpreemptive_fast(procs),
+    "prio_np": lambda procs, _q: schedule_priority_nonpreemptive_fast(procs),
+    "srtf": lambda procs, _q: schedule_srtf_preemptive_fast(procs),
+    "prio_p": lambda procs, _q: schedule_priority_preemptive_fast(procs),
+    "rr": lambda procs, q: schedule_round_robin_fast(procs, q),
+}
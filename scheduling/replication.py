@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .fcfs import schedule_fcfs
+from .models import Process, Segment, compute_metrics
+from .priority_nonpreemptive import schedule_priority_nonpreemptive
+from .priority_preemptive import schedule_priority_preemptive
+from .round_robin import schedule_round_robin
+from .sjf_nonpreemptive import schedule_sjf_nonpreemptive
+from .srtf_preemptive import schedule_srtf_preemptive
+
+SCHEDULERS: Dict[str, Callable[[Sequence[Process], int], List[Segment]]] = {
+    "fcfs": lambda procs, _q: schedule_fcfs(procs),
+    "sjf": lambda procs, _q: schedule_sjf_nonpreemptive(procs),
+    "prio_np": lambda procs, _q: schedule_priority_nonpreemptive(procs),
+    "srtf": lambda procs, _q: schedule_srtf_preemptive(procs),
+    "prio_p": lambda procs, _q: schedule_priority_preemptive(procs),
+    "rr": lambda procs, q: schedule_round_robin(procs, q),
+}
+
+METRIC_NAMES: Tuple[str, ...] = ("avg_waiting", "avg_turnaround", "makespan")
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Distribution of randomized workloads (all ranges are inclusive)."""
+
+    n_processes: int = 8
+    arrival_range: Tuple[int, int] = (0, 20)
+    burst_range: Tuple[int, int] = (1, 10)
+    priority_range: Tuple[int, int] = (0, 5)
+
+    def validate(self) -> None:
+        if self.n_processes <= 0:
+            raise ValueError("n_processes must be > 0")
+        for name, (lo, hi), floor in (
+            ("arrival_range", self.arrival_range, 0),
+            ("burst_range", self.burst_range, 1),
+            ("priority_range", self.priority_range, 0),
+        ):
+            if lo < floor:
+                raise ValueError(f"{name} lower bound must be >= {floor}")
+            if hi < lo:
+                raise ValueError(f"{name} upper bound must be >= lower bound")
+
+
+def generate_workload(spec: WorkloadSpec, seed: int) -> List[Process]:
+    """Build one workload; the same (spec, seed) always yields the same processes."""
+    rng = random.Random(seed)
+    return [
+        Process(
+            pid=f"P{i + 1}",
+            arrival=rng.randint(*spec.arrival_range),
+            burst=rng.randint(*spec.burst_range),
+            priority=rng.randint(*spec.priority_range),
+        )
+        for i in range(spec.n_processes)
+    ]
+
+
+@dataclass
+class RunningStats:
+    """Streaming mean/variance (Welford's algorithm).
+
+    `confidence` is the default level for `half_width` and `interval`.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    confidence: float = 0.95
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 until two observations are seen)."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def half_width(self, confidence: Optional[float] = None) -> float:
+        """Half-width of the normal-approximation confidence interval for the mean.
+
+        Uses the z quantile, so intervals are too narrow for small samples; rely on
+        them only after roughly 30 or more observations.
+        """
+        if self.count < 2:
+            return math.inf
+        if confidence is None:
+            confidence = self.confidence
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * self.stdev / math.sqrt(self.count)
+
+    def interval(self, confidence: Optional[float] = None) -> Tuple[float, float]:
+        hw = self.half_width(confidence)
+        return self.mean - hw, self.mean + hw
+
+
+@dataclass
+class ReplicationResult:
+    replications: int
+    converged: bool
+    confidence: float
+    stats: Dict[str, Dict[str, RunningStats]] = field(default_factory=dict)  # algo -> metric -> stats
+
+    def interval(self, algorithm: str, metric: str) -> Tuple[float, float]:
+        """Confidence interval for `metric` of `algorithm` at the run's confidence level."""
+        return self.stats[algorithm][metric].interval(self.confidence)
+
+
+def _evaluate(spec: WorkloadSpec, seed: int, algorithms: Tuple[str, ...], quantum: int) -> Dict[str, Dict[str, float]]:
+    processes = generate_workload(spec, seed)
+    out: Dict[str, Dict[str, float]] = {}
+    for key in algorithms:
+        segments = SCHEDULERS[key](processes, quantum)
+        metrics = compute_metrics(processes, segments)
+        out[key] = {
+            "avg_waiting": sum(m.waiting for m in metrics.values()) / len(metrics),
+            "avg_turnaround": sum(m.turnaround for m in metrics.values()) / len(metrics),
+            "makespan": float(max(m.completion for m in metrics.values())),
+        }
+    return out
+
+
+def _evaluate_range(
+    spec: WorkloadSpec, start: int, stop: int, algorithms: Tuple[str, ...], quantum: int
+) -> List[Dict[str, Dict[str, float]]]:
+    return [_evaluate(spec, seed, algorithms, quantum) for seed in range(start, stop)]
+
+
+def _converged(stats: Dict[str, Dict[str, RunningStats]], confidence: float, precision: float, relative: bool) -> bool:
+    for per_metric in stats.values():
+        for s in per_metric.values():
+            hw = s.half_width(confidence)
+            limit = precision * abs(s.mean) if relative else precision
+            if hw > limit:
+                return False
+    return True
+
+
+def run_replications(
+    spec: WorkloadSpec,
+    algorithms: Sequence[str],
+    *,
+    replications: int = 1000,
+    base_seed: int = 0,
+    quantum: int = 2,
+    confidence: float = 0.95,
+    precision: Optional[float] = None,
+    relative: bool = True,
+    min_replications: int = 30,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> ReplicationResult:
+    """Evaluate `algorithms` over up to `replications` seeded workloads drawn from `spec`.
+
+    Workload i uses seed ``base_seed + i``, so results are reproducible regardless of
+    worker count. When `precision` is set, runs stop early once every metric's
+    confidence-interval half-width is within it (relative to the mean unless
+    `relative` is False), checked as each chunk of `batch_size` workloads completes and
+    never before `min_replications`. Intervals use a normal approximation, so keep
+    `min_replications` around 30 or more when stopping early; it must be at least 2.
+    `max_workers=1` evaluates in-process without a pool.
+    """
+    spec.validate()
+    algos = tuple(algorithms)
+    if not algos:
+        raise ValueError("No algorithms selected.")
+    for key in algos:
+        if key not in SCHEDULERS:
+            raise ValueError(f"Unknown algorithm: {key}")
+    if replications <= 0:
+        raise ValueError("replications must be > 0")
+    if quantum <= 0:
+        raise ValueError("Quantum must be > 0")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if precision is not None and precision <= 0:
+        raise ValueError("precision must be > 0")
+    if min_replications < 2:
+        raise ValueError("min_replications must be >= 2")
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be > 0")
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if batch_size is None:
+        # Enough chunks to balance the workers; smaller ones when early stopping is on
+        # so convergence is checked often without paying IPC per workload.
+        batch_size = max(1, math.ceil(replications / (4 * workers)))
+        if precision is not None:
+            batch_size = min(batch_size, 256)
+
+    stats: Dict[str, Dict[str, RunningStats]] = {
+        key: {name: RunningStats(confidence=confidence) for name in METRIC_NAMES} for key in algos
+    }
+    done = 0
+    converged = False
+
+    chunks = [
+        (start, min(start + batch_size, base_seed + replications))
+        for start in range(base_seed, base_seed + replications, batch_size)
+    ]
+
+    def consume(results: List[Dict[str, Dict[str, float]]]) -> bool:
+        # Chunks are consumed in seed order, so the aggregate is independent of scheduling.
+        nonlocal done
+        for res in results:
+            for key, values in res.items():
+                for name, value in values.items():
+                    stats[key][name].add(value)
+        done += len(results)
+        return precision is not None and done >= min_replications and _converged(stats, confidence, precision, relative)
+
+    if workers == 1:
+        for start, stop in chunks:
+            if consume(_evaluate_range(spec, start, stop, algos, quantum)):
+                converged = True
+                break
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending: Deque[Future] = deque()
+        next_chunk = 0
+        try:
+            while next_chunk < len(chunks) or pending:
+                # Keep a bounded number of chunks in flight so an early stop wastes little work.
+                while next_chunk < len(chunks) and len(pending) < 2 * workers:
+                    start, stop = chunks[next_chunk]
+                    pending.append(pool.submit(_evaluate_range, spec, start, stop, algos, quantum))
+                    next_chunk += 1
+                if consume(pending.popleft().result()):
+                    converged = True
+                    break
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    return ReplicationResult(replications=done, converged=converged, confidence=confidence, stats=stats)
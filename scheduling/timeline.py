@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence
+
+from .models import Segment
+
+
+class _PidRuns:
+    """Sorted runs of a single PID with prefix sums of their durations."""
+
+    __slots__ = ("starts", "ends", "prefix")
+
+    def __init__(self) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.prefix: List[int] = [0]  # prefix[i] = total time of runs[:i]
+
+    def add(self, seg: Segment) -> None:
+        self.starts.append(seg.start)
+        self.ends.append(seg.end)
+        self.prefix.append(self.prefix[-1] + (seg.end - seg.start))
+
+
+class TimelineIndex:
+    """Queryable index over a schedule timeline.
+
+    Built once in O(n) from the (sorted, non-overlapping) segments returned by the
+    schedulers; point and range queries then cost O(log n), plus O(k) for `slice`.
+    Half-open intervals [a, b) are used throughout, matching `Segment`.
+    """
+
+    def __init__(self, segments: Sequence[Segment]):
+        self.segments: List[Segment] = list(segments)
+        self._starts: List[int] = []
+        self._runs: Dict[str, _PidRuns] = {}
+        self._switch_times: List[int] = []
+
+        last_pid: Optional[str] = None
+        prev_end: Optional[int] = None
+        for seg in self.segments:
+            if seg.end <= seg.start:
+                raise ValueError(f"Empty or inverted segment: {seg}")
+            if prev_end is not None and seg.start < prev_end:
+                raise ValueError("Segments must be sorted and non-overlapping")
+            prev_end = seg.end
+            self._starts.append(seg.start)
+            self._runs.setdefault(seg.pid, _PidRuns()).add(seg)
+            if seg.pid == "IDLE":
+                continue
+            # A context switch is dispatching a process other than the last one that ran.
+            if last_pid is not None and seg.pid != last_pid:
+                self._switch_times.append(seg.start)
+            last_pid = seg.pid
+
+    @property
+    def start(self) -> int:
+        return self.segments[0].start if self.segments else 0
+
+    @property
+    def end(self) -> int:
+        return self.segments[-1].end if self.segments else 0
+
+    def pids(self) -> List[str]:
+        return [pid for pid in self._runs if pid != "IDLE"]
+
+    def segment_at(self, t: int) -> Optional[Segment]:
+        i = bisect_right(self._starts, t) - 1
+        if i < 0:
+            return None
+        seg = self.segments[i]
+        return seg if t < seg.end else None
+
+    def running_at(self, t: int) -> Optional[str]:
+        """PID on the CPU at time t ("IDLE" if idle, None outside the timeline)."""
+        seg = self.segment_at(t)
+        return seg.pid if seg is not None else None
+
+    def cpu_time(self, pid: str, a: int, b: int) -> int:
+        """Time `pid` spent on the CPU within [a, b)."""
+        runs = self._runs.get(pid)
+        if runs is None or b <= a:
+            return 0
+        # First run ending after a, last run starting before b.
+        lo = bisect_right(runs.ends, a)
+        hi = bisect_left(runs.starts, b)
+        if lo >= hi:
+            return 0
+        total = runs.prefix[hi] - runs.prefix[lo]
+        total -= max(0, a - runs.starts[lo])
+        total -= max(0, runs.ends[hi - 1] - b)
+        return total
+
+    def total_time(self, pid: str) -> int:
+        runs = self._runs.get(pid)
+        return runs.prefix[-1] if runs is not None else 0
+
+    def context_switches(self, a: Optional[int] = None, b: Optional[int] = None) -> int:
+        """Number of context switches occurring at times in [a, b)."""
+        lo = 0 if a is None else bisect_left(self._switch_times, a)
+        hi = len(self._switch_times) if b is None else bisect_left(self._switch_times, b)
+        return max(0, hi - lo)
+
+    def slice(self, a: int, b: int) -> List[Segment]:
+        """Segments overlapping [a, b), clipped to that window."""
+        if b <= a:
+            return []
+        i = max(0, bisect_right(self._starts, a) - 1)
+        j = bisect_left(self._starts, b)
+        out: List[Segment] = []
+        for k in range(i, j):
+            seg = self.segments[k]
+            if seg.end <= a:
+                continue
+            out.append(Segment(start=max(seg.start, a), end=min(seg.end, b), pid=seg.pid))
+        return out
+
+    def utilization(self, a: Optional[int] = None, b: Optional[int] = None) -> float:
+        """Fraction of [a, b) (default: whole timeline) the CPU was busy."""
+        a = self.start if a is None else a
+        b = self.end if b is None else b
+        if b <= a:
+            return 0.0
+        idle = self.cpu_time("IDLE", a, b)
+        covered = min(b, self.end) - max(a, self.start)
+        busy = max(0, covered) - idle
+        return busy / (b - a)
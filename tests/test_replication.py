@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import random
+import statistics
+
+from scheduling.replication import RunningStats, WorkloadSpec, run_replications
+
+
+def test_running_stats_matches_statistics() -> None:
+    rng = random.Random(42)
+    data = [rng.uniform(-50, 50) for _ in range(500)]
+    rs = RunningStats()
+    for x in data:
+        rs.add(x)
+    assert rs.count == len(data)
+    assert abs(rs.mean - statistics.mean(data)) < 1e-9
+    assert abs(rs.variance - statistics.variance(data)) < 1e-9
+
+
+def test_results_independent_of_worker_count() -> None:
+    kwargs = dict(replications=200, base_seed=7, quantum=3)
+    algos = ["fcfs", "sjf", "srtf", "prio_p", "rr"]
+    serial = run_replications(WorkloadSpec(), algos, max_workers=1, **kwargs)
+    parallel = run_replications(WorkloadSpec(), algos, max_workers=2, batch_size=17, **kwargs)
+    assert serial.replications == parallel.replications == 200
+    assert serial.stats == parallel.stats
+
+
+def test_early_stop_on_loose_precision() -> None:
+    result = run_replications(WorkloadSpec(), ["sjf"], replications=5000, precision=0.2, batch_size=50, max_workers=1)
+    assert result.converged
+    assert result.replications < 5000
+    lo, hi = result.interval("sjf", "avg_waiting")
+    mean = result.stats["sjf"]["avg_waiting"].mean
+    assert hi - mean <= 0.2 * mean and lo < mean < hi